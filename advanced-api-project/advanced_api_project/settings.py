@@ -44,6 +44,11 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Compress responses (JSON compresses 5-10x); also adds Vary: Accept-Encoding
+    'django.middleware.gzip.GZipMiddleware',
+    # ETag/Last-Modified for GET responses and 304s for matching conditional
+    # requests; after GZip so the ETag is computed on the uncompressed body
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -83,6 +88,45 @@ DATABASES = {
 }
 
 
+# Django REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+REST_FRAMEWORK = {
+    # orjson encodes list responses several times faster than stdlib json
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    # Turns the pub_year_not_future constraint's IntegrityError into a 400
+    'EXCEPTION_HANDLER': 'api.exceptions.exception_handler',
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# 'api-lists' and 'api-details' hold cached responses and are kept separate
+# from the default cache. Writes evict them (see api.models), but LocMemCache
+# is per process: with several workers only the one that handled the write
+# is evicted, and the others serve old data until the entries time out
+# (5 minutes for lists, 1 hour for details). Point both aliases at a shared
+# backend (Redis, Memcached) before running more than one worker.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'api-lists': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'api-lists',
+    },
+    # Cached book detail data and ETags; evicted per book on Book writes
+    'api-details': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'api-details',
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
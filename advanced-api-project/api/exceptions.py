@@ -0,0 +1,25 @@
+# api/exceptions.py
+
+from django.db import IntegrityError
+from rest_framework import serializers
+from rest_framework.views import exception_handler as drf_exception_handler
+
+# CHECK constraint added on PostgreSQL by migration 0007
+PUB_YEAR_CONSTRAINT = 'pub_year_not_future'
+
+
+def exception_handler(exc, context):
+    """
+    DRF's exception handler, plus a 400 for future publication years
+    rejected by the database.
+
+    - BookSerializer.validate_publication_year normally rejects them first,
+      but around New Year the database's now() and the app's current_year()
+      can disagree, and the INSERT/UPDATE then fails the CHECK constraint.
+    - Any other IntegrityError is left alone (re-raised as a 500).
+    """
+    if isinstance(exc, IntegrityError) and PUB_YEAR_CONSTRAINT in str(exc):
+        exc = serializers.ValidationError(
+            {'publication_year': ['Publication year cannot be in the future.']}
+        )
+    return drf_exception_handler(exc, context)
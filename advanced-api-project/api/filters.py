@@ -0,0 +1,70 @@
+# api/filters.py
+
+from django.utils.safestring import mark_safe
+from django_filters import rest_framework as filters_django
+from rest_framework import filters
+from .models import Book
+
+
+class BookFilter(filters_django.FilterSet):
+    """
+    FilterSet for the book list endpoint.
+
+    - Declared once at import time. With `filterset_fields` on the view,
+      DjangoFilterBackend builds a new FilterSet class on every request.
+    - ?author=<id> and ?publication_year=<year> are exact matches.
+    - ?year_min=<year> / ?year_max=<year> filter a publication year range;
+      with ?author= they are served by the (author, publication_year) index.
+    - ?title=<text> matches titles containing the text (case-insensitive).
+    """
+
+    year_min = filters_django.NumberFilter(field_name='publication_year', lookup_expr='gte')
+    year_max = filters_django.NumberFilter(field_name='publication_year', lookup_expr='lte')
+    title = filters_django.CharFilter(lookup_expr='icontains')
+
+    class Meta:
+        model = Book
+        fields = ['author', 'publication_year']
+
+
+class BookListFilterBackend(filters.BaseFilterBackend):
+    """
+    DjangoFilterBackend, SearchFilter and OrderingFilter as one backend.
+
+    - Each backend only runs when one of its query parameters is present,
+      so a plain list request skips FilterSet validation and search parsing.
+    - Without ?ordering= the view's default `ordering` is applied directly,
+      which is what OrderingFilter would do.
+    - The filter form (browsable API) and schema parameters still come from
+      all three backends.
+    """
+
+    filterset_backend = filters_django.DjangoFilterBackend()
+    search_backend = filters.SearchFilter()
+    ordering_backend = filters.OrderingFilter()
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        if not params.keys().isdisjoint(view.filterset_class.base_filters):
+            queryset = self.filterset_backend.filter_queryset(request, queryset, view)
+        if params.get(self.search_backend.search_param):
+            queryset = self.search_backend.filter_queryset(request, queryset, view)
+        if self.ordering_backend.ordering_param in params:
+            return self.ordering_backend.filter_queryset(request, queryset, view)
+        return queryset.order_by(*view.ordering)
+
+    def _backends(self):
+        return (self.filterset_backend, self.search_backend, self.ordering_backend)
+
+    def to_html(self, request, queryset, view):
+        return mark_safe(''.join(
+            backend.to_html(request, queryset, view) or ''
+            for backend in self._backends()
+        ))
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            parameter
+            for backend in self._backends()
+            for parameter in backend.get_schema_operation_parameters(view)
+        ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:18
+
+from django.db import migrations
+
+
+# ?search= compiles to ILIKE '%term%', which a btree index can't serve.
+# A pg_trgm GIN index can, and the planner picks it automatically.
+# It only exists on PostgreSQL, so it isn't declared in Book.Meta.indexes
+# (that would break SQLite, the default backend); other backends skip it.
+
+def create_title_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS book_title_trgm '
+        'ON api_book USING gin (title gin_trgm_ops)'
+    )
+
+
+def drop_title_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS book_title_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_book_api_book_publica_3c93d9_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_title_trgm_index, drop_title_trgm_index),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:21
+
+from django.db import migrations
+
+
+# ?search= also matches author__name with ILIKE '%term%' across the join.
+# Same as book_title_trgm (0003): a PostgreSQL-only pg_trgm GIN index, so
+# both sides of the search are index lookups; other backends skip it.
+
+def create_author_name_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS author_name_trgm '
+        'ON api_author USING gin (name gin_trgm_ops)'
+    )
+
+
+def drop_author_name_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS author_name_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_book_api_book_title_dc9757_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_author_name_trgm_index, drop_author_name_trgm_index),
+    ]
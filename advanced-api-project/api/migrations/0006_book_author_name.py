@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:40
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_author_name(apps, schema_editor):
+    Author = apps.get_model('api', 'Author')
+    Book = apps.get_model('api', 'Book')
+    Book.objects.update(author_name=Subquery(
+        Author.objects.filter(pk=OuterRef('author_id')).values('name')[:1]
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_author_name_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='author_name',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=200),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_author_name, migrations.RunPython.noop),
+    ]
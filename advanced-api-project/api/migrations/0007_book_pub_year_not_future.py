@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:02
+
+from django.db import migrations
+
+
+# Database-level guard for the rule BookSerializer.validate_publication_year
+# enforces, so writes that skip the serializer (admin, shell, bulk scripts)
+# can't store a future year either. A Meta CheckConstraint would freeze
+# today's year into the migration, and SQLite rejects non-deterministic
+# functions in CHECK, so this is a PostgreSQL-only constraint on now().
+
+def add_pub_year_not_future(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'ALTER TABLE api_book ADD CONSTRAINT pub_year_not_future '
+        'CHECK (publication_year <= EXTRACT(YEAR FROM now()))'
+    )
+
+
+def drop_pub_year_not_future(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'ALTER TABLE api_book DROP CONSTRAINT IF EXISTS pub_year_not_future'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_book_author_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_pub_year_not_future, drop_pub_year_not_future),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:40
+
+from django.db import migrations
+
+
+# Since 0006, ?search= matches the denormalized api_book.author_name rather
+# than api_author.name across the join. Its btree db_index can't serve
+# ILIKE '%term%', so give it the same PostgreSQL-only pg_trgm GIN index as
+# title (0003), and drop author_name_trgm (0005), which no query uses now.
+
+def create_book_author_name_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS book_author_name_trgm '
+        'ON api_book USING gin (author_name gin_trgm_ops)'
+    )
+    schema_editor.execute('DROP INDEX IF EXISTS author_name_trgm')
+
+
+def drop_book_author_name_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS author_name_trgm '
+        'ON api_author USING gin (name gin_trgm_ops)'
+    )
+    schema_editor.execute('DROP INDEX IF EXISTS book_author_name_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_book_pub_year_not_future'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_book_author_name_trgm_index, drop_book_author_name_trgm_index
+        ),
+    ]
@@ -1,4 +1,8 @@
-from django.db import models
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models import Subquery
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 # Author model — an author can have many books
 class Author(models.Model):
@@ -8,11 +12,145 @@ class Author(models.Model):
         return self.name
 
 
+def sync_author_names(books):
+    """
+    Copy each book's author name into book.author_name.
+    Authors already cached on the book are used directly; the rest are
+    fetched in one query.
+    """
+    missing = {book.author_id for book in books if not Book.author.is_cached(book)}
+    names = dict(
+        Author.objects.filter(pk__in=missing).values_list('id', 'name')
+    ) if missing else {}
+    for book in books:
+        if Book.author.is_cached(book):
+            book.author_name = book.author.name
+        else:
+            book.author_name = names[book.author_id]
+
+
+# bulk_create/bulk_update skip Book.save(), so they keep author_name in sync here
+class BookQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        sync_author_names(objs)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs, fields = list(objs), list(fields)
+        if 'author' in fields and 'author_name' not in fields:
+            sync_author_names(objs)
+            fields.append('author_name')
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+
 # Book model — each book belongs to one author
 class Book(models.Model):
     title = models.CharField(max_length=200)
     publication_year = models.IntegerField()
     author = models.ForeignKey(Author, related_name='books', on_delete=models.CASCADE)
+    # Copy of author.name so search/ordering by author don't need a JOIN.
+    # Kept in sync by save(), BookQuerySet and sync_book_author_names below.
+    # db_index serves ordering; ?search= uses a pg_trgm index (migration 0008).
+    author_name = models.CharField(max_length=200, db_index=True, editable=False)
+
+    objects = BookQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # ?publication_year= filter and ?ordering=publication_year
+            models.Index(fields=['publication_year']),
+            # ?author= filter ordered by year, and an author's books by year
+            models.Index(fields=['author', 'publication_year']),
+            # Default book list ordering (title) and exact title lookups
+            models.Index(fields=['title']),
+        ]
 
     def __str__(self):
         return self.title
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets save() tell whether author_name still matches the row
+        instance._saved_author_id = instance.__dict__.get('author_id')
+        return instance
+
+    def _author_name_for_save(self):
+        """
+        New value for author_name, or None if the stored one is still right.
+        A cached author supplies the name directly; otherwise a subquery reads
+        it inside the INSERT/UPDATE rather than in a SELECT of its own.
+        """
+        if Book.author.is_cached(self):
+            return self.author.name
+        if 'author_id' in self.get_deferred_fields():
+            return None
+        if not self._state.adding and self.author_id == getattr(self, '_saved_author_id', None):
+            return None
+        return Subquery(Author.objects.filter(pk=self.author_id).values('name')[:1])
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or not {'author', 'author_id'}.isdisjoint(update_fields):
+            author_name = self._author_name_for_save()
+            if author_name is not None:
+                self.author_name = author_name
+                if update_fields is not None:
+                    kwargs['update_fields'] = {*update_fields, 'author_name'}
+        super().save(*args, **kwargs)
+        if isinstance(self.__dict__.get('author_name'), Subquery):
+            # Leave the field deferred; it's loaded on first access
+            del self.__dict__['author_name']
+        self._saved_author_id = self.__dict__.get('author_id')
+
+
+# Renaming an author rewrites the denormalized name on their books
+@receiver(post_save, sender=Author)
+def sync_book_author_names(sender, instance, created, **kwargs):
+    if created:
+        # A new author has no books yet
+        return
+    Book.objects.filter(author=instance).exclude(
+        author_name=instance.name
+    ).update(author_name=instance.name)
+
+
+# Cached list responses embed both books and authors (nested books, author
+# name search), so any write to either model clears the list cache.
+# The signals fire inside the write's transaction; clearing before COMMIT
+# would let a concurrent GET re-cache the old rows, so wait for on_commit.
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def invalidate_list_cache(sender, **kwargs):
+    transaction.on_commit(caches['api-lists'].clear)
+
+
+def book_detail_cache_keys(pk):
+    """Keys in the 'api-details' cache for a book's detail data and ETag."""
+    return f'book-detail:{pk}', f'book-etag:{pk}'
+
+
+# Book detail responses only embed the author's id, so only writes to that
+# Book (including cascaded deletes) evict them. Dropping the ETag too means
+# clients holding an old ETag get a fresh 200. Deferred to on_commit like
+# invalidate_list_cache; the keys are taken now, while instance.pk is set.
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def invalidate_detail_cache(sender, instance, **kwargs):
+    keys = book_detail_cache_keys(instance.pk)
+    transaction.on_commit(lambda: caches['api-details'].delete_many(keys))
+
+
+def invalidate_book_caches(books):
+    """
+    Do what the receivers above would for each book.
+    bulk_create/bulk_update don't send post_save, so callers run this after
+    the rows are committed.
+    """
+    caches['api-lists'].clear()
+    caches['api-details'].delete_many(
+        [key for book in books for key in book_detail_cache_keys(book.pk)]
+    )
@@ -0,0 +1,17 @@
+# api/pagination.py
+
+from rest_framework.pagination import PageNumberPagination
+
+
+class ListPagination(PageNumberPagination):
+    """
+    Page-number pagination for the book and author list endpoints.
+
+    - ?page=<n> selects the page; the ORM issues LIMIT/OFFSET for it.
+    - ?page_size=<n> lets clients ask for bigger or smaller pages,
+      capped at max_page_size so one request can't pull the whole table.
+    """
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
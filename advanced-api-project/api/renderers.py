@@ -0,0 +1,42 @@
+# api/renderers.py
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson instead of the stdlib json module.
+
+    - Compact output is encoded by orjson's C encoder; types orjson doesn't
+      know (lazy strings, Decimal, querysets...) and datetimes fall back to
+      DRF's encoder, so the bytes match the stock renderer.
+    - Indented output (e.g. `Accept: application/json; indent=4` or the
+      browsable API) is left to the stock renderer, it isn't a hot path.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Validation errors are keyed by ErrorDetail (a str subclass), which
+        # orjson only accepts as a key with OPT_NON_STR_KEYS. Datetimes and
+        # dataclasses are passed through to DRF's encoder: orjson formats
+        # UTC as +00:00 where DRF writes Z, and DRF doesn't encode dataclasses.
+        ret = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=(
+                orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+            ),
+        )
+
+        # Match JSONRenderer: escape U+2028/U+2029 so output stays a
+        # strict javascript subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -2,30 +2,65 @@
 
 from rest_framework import serializers
 from .models import Author, Book
+from functools import lru_cache
+from operator import attrgetter
+import copy
 import datetime
+import time
 
 
-class BookSerializer(serializers.ModelSerializer):
+@lru_cache(maxsize=1)
+def _year_for_day(day):
+    # `day` is only the cache key: a new day number forces one recomputation
+    return datetime.date.today().year
+
+
+def current_year():
+    """
+    Return the current year, recomputed at most once per day.
+    Avoids building a date object on every validated payload.
+    """
+    return _year_for_day(int(time.time()) // 86400)
+
+
+class CachedFieldsMixin:
+    """
+    ModelSerializer introspects the model and builds every field on each
+    instantiation. Build them once per class and return deep copies,
+    the same way DRF itself copies declared fields per instance.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        if '_built_fields' not in cls.__dict__:
+            cls._built_fields = super().get_fields()
+        return copy.deepcopy(cls._built_fields)
+
+
+BOOK_FIELDS = ('id', 'title', 'publication_year', 'author')
+
+
+class BookSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializes Book model fields and enforces validation.
 
     - Converts Book model instances to plain data (for JSON responses).
     - Converts incoming JSON into Book fields when creating/updating.
     - validate_publication_year ensures the year isn't in the future.
+    - CachedFieldsMixin builds the model fields once per class.
     """
 
     class Meta:
         # Tell DRF which model and which fields to include in serialized output
         model = Book
-        fields = ['id', 'title', 'publication_year', 'author']
+        fields = BOOK_FIELDS
 
     def validate_publication_year(self, value):
         """
         Field-level validation for 'publication_year'.
         DRF automatically calls this when deserializing incoming data.
         """
-        current_year = datetime.date.today().year
-        if value > current_year:
+        if value > current_year():
             # Raise a ValidationError to stop bad data from being saved
             raise serializers.ValidationError(
                 'Publication year cannot be in the future.'
@@ -33,18 +68,66 @@ class BookSerializer(serializers.ModelSerializer):
         return value
 
 
-class AuthorSerializer(serializers.ModelSerializer):
+class AuthorSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializes Author model and nests related books.
 
     - The `books` field uses the related_name='books' defined on Book.author.
-    - many=True because an author can have multiple books.
-    - read_only=True because, in this simple example, we only display nested books.
+    - It is a read-only method field: each book becomes a plain dict in the
+      BookSerializer shape instead of running a nested BookSerializer per book.
       (If you want to create books while creating an author, you need writable nested logic.)
+    - Views should prefetch `books` so obj.books.all() doesn't hit the database.
+      Books are listed newest first either way.
+    - CachedFieldsMixin builds the model fields once per class.
     """
 
-    books = BookSerializer(many=True, read_only=True)
+    books = serializers.SerializerMethodField()
 
     class Meta:
         model = Author
         fields = ['id', 'name', 'books']
+
+    def get_books(self, obj):
+        # The views' prefetch already orders newest first, but after an
+        # update DRF drops the prefetch cache and obj.books.all() is
+        # unordered; sorting the (usually presorted) list keeps one order
+        books = sorted(
+            obj.books.all(), key=attrgetter('publication_year'), reverse=True
+        )
+        return [book_dict(book) for book in books]
+
+
+# Read-only fast path for list endpoints.
+# Building plain dicts skips ModelSerializer's per-field machinery, which
+# dominates CPU time when serializing many rows. The output shape matches
+# BookSerializer/AuthorSerializer so clients see no difference.
+BOOK_LIST_FIELDS = ('id', 'title', 'publication_year', 'author_id')
+
+
+def book_dict(book):
+    """Build a book representation from a Book instance."""
+    return {
+        'id': book.id,
+        'title': book.title,
+        'publication_year': book.publication_year,
+        'author': book.author_id,
+    }
+
+
+def list_book_dict(row):
+    """Build a book representation from a .values(*BOOK_LIST_FIELDS) row."""
+    return {
+        'id': row['id'],
+        'title': row['title'],
+        'publication_year': row['publication_year'],
+        'author': row['author_id'],
+    }
+
+
+def list_author_dict(author):
+    """Build an author representation from an Author with prefetched books."""
+    return {
+        'id': author.id,
+        'name': author.name,
+        'books': [book_dict(book) for book in author.books.all()],
+    }
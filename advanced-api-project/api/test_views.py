@@ -3,54 +3,78 @@ Unit Tests for Book API Views
 File: api/test_views.py
 """
 
-from django.test import TestCase
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
 from rest_framework.test import APIClient
 from rest_framework import status
-from .models import Author, Book
+from .models import Author, Book, book_detail_cache_keys
+from .serializers import BookSerializer
 from datetime import datetime
 
+# PBKDF2 dominates fixture and login cost; tests don't need a strong hash
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class BookAPITestCase(TestCase):
     """Base test case with setup for all tests"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
         Configure test environment with separate test database.
-        Creates test data without affecting production/development databases.
+        Creates test data once per class; each test runs inside a
+        transaction that is rolled back, so tests still start from this state.
         """
         # Create test users
-        self.admin_user = User.objects.create_user(
+        cls.admin_user = User.objects.create_user(
             username='admin',
             password='password123',
             email='admin@example.com'
         )
-        self.regular_user = User.objects.create_user(
+        cls.regular_user = User.objects.create_user(
             username='regular',
             password='password123',
             email='regular@example.com'
         )
         
-        # Create test authors
-        self.author1 = Author.objects.create(name='J.K. Rowling')
-        self.author2 = Author.objects.create(name='George R.R. Martin')
+        # Create test authors (one INSERT for all rows)
+        cls.author1, cls.author2 = Author.objects.bulk_create([
+            Author(name='J.K. Rowling'),
+            Author(name='George R.R. Martin'),
+        ])
         
         # Create test books
-        self.book1 = Book.objects.create(
-            title='Harry Potter and the Philosopher\'s Stone',
-            publication_year=1997,
-            author=self.author1
-        )
-        self.book2 = Book.objects.create(
-            title='A Game of Thrones',
-            publication_year=1996,
-            author=self.author2
-        )
-        
+        cls.book1, cls.book2 = Book.objects.bulk_create([
+            Book(
+                title='Harry Potter and the Philosopher\'s Stone',
+                publication_year=1997,
+                author=cls.author1
+            ),
+            Book(
+                title='A Game of Thrones',
+                publication_year=1996,
+                author=cls.author2
+            ),
+        ])
+        # Known fixture size, so tests don't need a COUNT(*) before mutating
+        cls.initial_book_count = 2
+    
+    def setUp(self):
+        """Per-test client state"""
         # Initialize API clients
         self.client = APIClient()
         self.admin_client = APIClient()
         self.regular_client = APIClient()
 
+        # Authenticate admin_client once; force_authenticate skips the
+        # auth backend and password hasher entirely
+        self.admin_client.force_authenticate(user=self.admin_user)
+
+        # Cached list responses outlive the per-test rollback, so start clean
+        caches['api-lists'].clear()
+        caches['api-details'].clear()
+
 class AuthenticationTests(BookAPITestCase):
     """Tests for authentication and permissions"""
     
@@ -99,29 +123,33 @@ class AuthenticationTests(BookAPITestCase):
 class CRUDTests(BookAPITestCase):
     """Tests for Create, Read, Update, Delete operations"""
     
-    def test_create_book_with_login(self):
-        """Test creating a book after logging in"""
-        # Login first
-        self.client.login(username='admin', password='password123')
-        
+    def test_create_book_authenticated(self):
+        """Test creating a book as an authenticated user"""
         data = {
             'title': 'The Hobbit',
             'publication_year': 1937,
             'author': self.author1.id
         }
-        response = self.client.post('/api/books/create/', data, format='json')
+        response = self.admin_client.post('/api/books/create/', data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Book.objects.count(), 3)  # 2 existing + 1 new
-        
-        # Logout
-        self.client.logout()
+        self.assertTrue(Book.objects.filter(pk=response.data['id']).exists())
     
     def test_retrieve_book_list(self):
         """Test retrieving all books"""
         response = self.client.get('/api/books/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(len(response.data['results']), 2)
+    
+    def test_paginate_book_list(self):
+        """Test that the book list is returned in pages"""
+        response = self.client.get('/api/books/?page=2&page_size=1')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIsNotNone(response.data['previous'])
+        self.assertIsNone(response.data['next'])
     
     def test_retrieve_single_book(self):
         """Test retrieving a specific book"""
@@ -131,35 +159,154 @@ class CRUDTests(BookAPITestCase):
     
     def test_update_book_with_authentication(self):
         """Test updating a book (requires authentication)"""
-        # Login required for update
-        self.client.login(username='admin', password='password123')
-        
         updated_data = {
             'title': 'Updated Book Title',
             'publication_year': 2000,
             'author': self.author1.id
         }
-        response = self.client.put(
+        response = self.admin_client.put(
             f'/api/books/{self.book1.id}/update/',
             updated_data,
             format='json'
         )
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.client.logout()
     
     def test_delete_book_with_authentication(self):
         """Test deleting a book (requires authentication)"""
-        # Login required for delete
-        self.client.login(username='admin', password='password123')
-        
-        initial_count = Book.objects.count()
-        response = self.client.delete(f'/api/books/{self.book1.id}/delete/')
+        response = self.admin_client.delete(f'/api/books/{self.book1.id}/delete/')
         
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertEqual(Book.objects.count(), initial_count - 1)
-        
-        self.client.logout()
+        self.assertFalse(Book.objects.filter(pk=self.book1.pk).exists())
+
+class GenericUpdateDeleteTests(BookAPITestCase):
+    """Tests for the update/delete views that take the book id in the body"""
+
+    def test_generic_update_by_id(self):
+        """Test updating the book named by 'id' in the request body"""
+        response = self.admin_client.patch(
+            '/api/books/update/', {'id': self.book2.id, 'title': 'A Game of Thrones (2nd ed.)'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], self.book2.id)
+
+    def test_generic_bulk_patch(self):
+        """Test updating several books in one PATCH"""
+        self.client.get(f'/api/books/{self.book1.id}/')  # cache the detail
+        response = self.admin_client.patch('/api/books/update/', {'items': [
+            {'id': self.book1.id, 'title': 'HP 1'},
+            {'id': self.book2.id, 'publication_year': 1999, 'author': self.author1.id},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.book1.refresh_from_db()
+        self.book2.refresh_from_db()
+        self.assertEqual(self.book1.title, 'HP 1')
+        self.assertEqual(self.book2.publication_year, 1999)
+        self.assertEqual(self.book2.author_name, self.author1.name)
+        # bulk_update sends no signals; the cached detail must still be evicted
+        response = self.client.get(f'/api/books/{self.book1.id}/')
+        self.assertEqual(response.data['title'], 'HP 1')
+
+    def test_generic_bulk_patch_rejects_invalid_items(self):
+        """Test that one invalid or unknown item rejects the whole PATCH"""
+        future_year = datetime.now().year + 1
+        response = self.admin_client.patch('/api/books/update/', {'items': [
+            {'id': self.book1.id, 'title': 'HP 1'},
+            {'id': self.book2.id, 'publication_year': future_year},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.admin_client.patch('/api/books/update/', {'items': [
+            {'id': 0, 'title': 'Nope'},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.admin_client.patch('/api/books/update/', {'items': [
+            {'id': self.book1.id, 'title': 'HP 1'},
+            {'id': self.book1.id, 'title': 'HP 2'},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        for bad_id in ('abc', [self.book1.id], {'id': self.book1.id}):
+            response = self.admin_client.patch('/api/books/update/', {'items': [
+                {'id': bad_id, 'title': 'HP 1'},
+            ]}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.book1.refresh_from_db()
+        self.assertNotEqual(self.book1.title, 'HP 1')
+
+    def test_generic_bulk_patch_accepts_string_ids(self):
+        """Test that numeric string ids are matched like integer ids"""
+        response = self.admin_client.patch('/api/books/update/', {'items': [
+            {'id': str(self.book1.id), 'title': 'HP 1'},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.book1.refresh_from_db()
+        self.assertEqual(self.book1.title, 'HP 1')
+
+    def test_generic_update_requires_id(self):
+        """Test that a missing id is rejected without touching any book"""
+        with self.assertNumQueries(0):
+            response = self.admin_client.patch(
+                '/api/books/update/', {'title': 'Overwritten'}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('id', response.data)
+
+    def test_generic_views_unknown_id(self):
+        """Test that an unknown or malformed id is a 404, not a server error"""
+        for book_id in (max(self.book1.id, self.book2.id) + 1, 'abc'):
+            response = self.admin_client.patch(
+                '/api/books/update/', {'id': book_id, 'title': 'Nope'}, format='json'
+            )
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            response = self.admin_client.delete(
+                '/api/books/delete/', {'id': book_id}, format='json'
+            )
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_generic_delete_by_id(self):
+        """Test deleting the book named by 'id' in the request body"""
+        response = self.admin_client.delete(
+            '/api/books/delete/', {'id': self.book1.id}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Book.objects.filter(pk=self.book1.pk).exists())
+
+    def test_generic_delete_requires_id(self):
+        """Test that a missing id deletes nothing"""
+        response = self.admin_client.delete('/api/books/delete/', {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(Book.objects.filter(pk=self.book1.pk).exists())
+
+class BulkCreateTests(BookAPITestCase):
+    """Tests for creating many books in one request"""
+
+    def test_bulk_create_books(self):
+        """Test that a list of books is created in one request"""
+        data = [
+            {'title': 'A Clash of Kings', 'publication_year': 1998, 'author': self.author2.id},
+            {'title': 'A Storm of Swords', 'publication_year': 2000, 'author': self.author2.id},
+        ]
+        response = self.admin_client.post('/api/books/bulk/', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(self.author2.books.count(), 3)
+
+    def test_bulk_create_rejects_invalid_rows(self):
+        """Test that one invalid row rejects the whole batch"""
+        data = [
+            {'title': 'A Clash of Kings', 'publication_year': 1998, 'author': self.author2.id},
+            {'title': 'Future Book', 'publication_year': datetime.now().year + 1, 'author': self.author2.id},
+        ]
+        response = self.admin_client.post('/api/books/bulk/', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Book.objects.filter(title='A Clash of Kings').exists())
+
+    def test_bulk_create_requires_authentication(self):
+        """Test that anonymous users cannot bulk create"""
+        response = self.client.post('/api/books/bulk/', [], format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 class FilterSearchOrderTests(BookAPITestCase):
     """Tests for filtering, searching, and ordering"""
@@ -168,13 +315,46 @@ class FilterSearchOrderTests(BookAPITestCase):
         """Test filtering books by author"""
         response = self.client.get(f'/api/books/?author={self.author1.id}')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
+    
+    def test_filter_by_publication_year_and_title(self):
+        """Test filtering books by publication year and title"""
+        response = self.client.get('/api/books/?publication_year=1996')
+        self.assertEqual([b['id'] for b in response.data['results']], [self.book2.id])
+        response = self.client.get('/api/books/', {'title': 'potter'})
+        self.assertEqual([b['id'] for b in response.data['results']], [self.book1.id])
+    
+    def test_filter_by_publication_year_range(self):
+        """Test filtering books by a publication year range"""
+        response = self.client.get('/api/books/?year_min=1997')
+        self.assertEqual([b['id'] for b in response.data['results']], [self.book1.id])
+        response = self.client.get('/api/books/?year_max=1996')
+        self.assertEqual([b['id'] for b in response.data['results']], [self.book2.id])
+        response = self.client.get('/api/books/?year_min=1990&year_max=2000')
+        self.assertEqual(response.data['count'], 2)
     
     def test_search_by_title(self):
         """Test searching books by title"""
         response = self.client.get('/api/books/?search=Harry')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
+    
+    def test_search_by_author_name(self):
+        """Test searching books by author name, kept in sync on rename"""
+        response = self.client.get('/api/books/?search=Martin')
+        self.assertEqual([b['id'] for b in response.data['results']], [self.book2.id])
+        
+        self.author2.name = 'G. R. R. Martin Jr'
+        self.author2.save()
+        response = self.client.get('/api/books/?search=Jr')
+        self.assertEqual([b['id'] for b in response.data['results']], [self.book2.id])
+    
+    def test_ordering_by_author_name(self):
+        """Test ordering books by author name"""
+        response = self.client.get('/api/books/?ordering=author_name')
+        self.assertEqual(
+            [b['id'] for b in response.data['results']], [self.book2.id, self.book1.id]
+        )
     
     def test_ordering_by_publication_year(self):
         """Test ordering books by publication year"""
@@ -182,29 +362,45 @@ class FilterSearchOrderTests(BookAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Check ordering (newest first)
-        years = [book['publication_year'] for book in response.data]
+        years = [book['publication_year'] for book in response.data['results']]
         self.assertEqual(years, [1997, 1996])  # 1997 then 1996
 
+    def test_default_ordering_and_filter_validation(self):
+        """Test that skipped backends keep default ordering and filter errors"""
+        response = self.client.get('/api/books/')
+        self.assertEqual(
+            [b['id'] for b in response.data['results']], [self.book2.id, self.book1.id]
+        )
+        response = self.client.get('/api/books/?year_min=abc')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 class ValidationTests(BookAPITestCase):
     """Tests for data validation"""
     
     def test_publication_year_validation(self):
         """Test that future publication years are rejected"""
-        # Login first
-        self.client.login(username='admin', password='password123')
-        
         future_year = datetime.now().year + 1
         data = {
             'title': 'Future Book',
             'publication_year': future_year,
             'author': self.author1.id
         }
-        response = self.client.post('/api/books/create/', data, format='json')
+        response = self.admin_client.post('/api/books/create/', data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('publication_year', response.data)
+
+    def test_publication_year_validation_on_update(self):
+        """Test that updates can't move a book into the future"""
+        future_year = datetime.now().year + 1
+        response = self.admin_client.patch(
+            f'/api/books/{self.book1.id}/update/',
+            {'publication_year': future_year},
+            format='json'
+        )
         
-        self.client.logout()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('publication_year', response.data)
 
 class TestDatabaseConfiguration(BookAPITestCase):
     """
@@ -221,8 +417,8 @@ class TestDatabaseConfiguration(BookAPITestCase):
         book_count = Book.objects.count()
         user_count = User.objects.count()
         
-        # Should only have data created in setUp() method
-        self.assertEqual(book_count, 2)  # book1 and book2
+        # Should only have data created in setUpTestData()
+        self.assertEqual(book_count, self.initial_book_count)  # book1 and book2
         self.assertEqual(user_count, 2)  # admin_user and regular_user
     
     def test_database_isolation(self):
@@ -230,8 +426,6 @@ class TestDatabaseConfiguration(BookAPITestCase):
         Demonstrate database isolation between tests.
         Data created in one test doesn't affect another.
         """
-        initial_book_count = Book.objects.count()
-        
         # Create a new book in this test
         new_book = Book.objects.create(
             title='Isolation Test Book',
@@ -240,18 +434,299 @@ class TestDatabaseConfiguration(BookAPITestCase):
         )
         
         # Should have increased by 1
-        self.assertEqual(Book.objects.count(), initial_book_count + 1)
+        self.assertEqual(Book.objects.count(), self.initial_book_count + 1)
         
         # This book won't exist in other tests' databases
         # Each test gets a fresh database
 
+class QueryEfficiencyTests(BookAPITestCase):
+    """Tests that list endpoints don't issue one query per row"""
+
+    def test_author_list_prefetches_books(self):
+        """Nested books are fetched in a single extra query"""
+        Book.objects.create(
+            title='Harry Potter and the Chamber of Secrets',
+            publication_year=1998,
+            author=self.author1
+        )
+        # 1 page count + 1 query for authors + 1 query for all their books
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/authors/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results'][0]['books']), 2)
+
+    def test_book_list_query_count_independent_of_rows(self):
+        """Book list (with an author_name search) costs a fixed number of queries"""
+        Book.objects.bulk_create([
+            Book(title=f'Song of Ice and Fire {i}', publication_year=2000, author=self.author2)
+            for i in range(5)
+        ])
+        # 1 page count + 1 query for the page, however many books match
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/books/?search=Martin')
+        self.assertEqual(response.data['count'], 6)
+
+    def test_book_detail_reads_only_the_book_table(self):
+        """Book detail is one query on api_book, with no join to api_author"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/books/{self.book1.id}/')
+        self.assertEqual(response.data['author'], self.author1.id)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('api_author', queries[0]['sql'])
+
+    def test_author_create_skips_book_name_sync(self):
+        """Creating an author doesn't issue an UPDATE on api_book"""
+        with self.assertNumQueries(1):
+            Author.objects.create(name='Ursula K. Le Guin')
+
+    def test_book_save_syncs_author_name_without_extra_queries(self):
+        """Book.save keeps author_name right without a separate author SELECT"""
+        with self.assertNumQueries(1):
+            book = Book.objects.create(
+                title='A Clash of Kings', publication_year=1998, author_id=self.author2.id
+            )
+        book = Book.objects.get(pk=book.pk)
+        self.assertEqual(book.author_name, self.author2.name)
+
+        book.title = 'A Clash of Kings (1st ed.)'
+        with self.assertNumQueries(1):
+            book.save(update_fields=['title'])
+        with self.assertNumQueries(1):
+            book.save()
+
+        book.author_id = self.author1.id
+        with self.assertNumQueries(1):
+            book.save()
+        self.assertEqual(book.author_name, self.author1.name)
+
+    def test_author_books_ordered_newest_first(self):
+        """Nested books are ordered by publication year, newest first"""
+        Book.objects.create(
+            title='Harry Potter and the Chamber of Secrets',
+            publication_year=1998,
+            author=self.author1
+        )
+        for url in ('/api/authors/', f'/api/authors/{self.author1.id}/'):
+            data = self.client.get(url).data
+            author = data['results'][0] if 'results' in data else data
+            years = [book['publication_year'] for book in author['books']]
+            self.assertEqual(years, [1998, 1997])
+        # UpdateModelMixin drops the prefetch cache before serializing
+        response = self.admin_client.patch(
+            f'/api/authors/{self.author1.id}/', {'name': 'J. K. Rowling'}, format='json'
+        )
+        years = [book['publication_year'] for book in response.data['books']]
+        self.assertEqual(years, [1998, 1997])
+
+    def test_book_list_matches_serializer_output(self):
+        """The list fast path returns the same shape as BookSerializer"""
+        response = self.client.get('/api/books/?ordering=title')
+        expected = BookSerializer(
+            Book.objects.order_by('title'), many=True
+        ).data
+        self.assertEqual(response.data['results'], [dict(b) for b in expected])
+
+    def test_author_detail_nests_books_in_serializer_shape(self):
+        """Nested books match BookSerializer output"""
+        response = self.client.get(f'/api/authors/{self.author1.id}/')
+        self.assertEqual(
+            response.data['books'], [dict(BookSerializer(self.book1).data)]
+        )
+
+class ListCacheTests(BookAPITestCase):
+    """Tests for cached list responses"""
+
+    def test_book_list_served_from_cache(self):
+        """A repeated list request doesn't touch the database"""
+        self.client.get('/api/books/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/books/')
+        self.assertEqual(response.data['count'], 2)
+
+    def test_book_list_cache_shared_across_users(self):
+        """Anonymous and authenticated clients share cached list data"""
+        self.client.get('/api/books/?ordering=title')
+        with self.assertNumQueries(0):
+            response = self.admin_client.get('/api/books/?ordering=title')
+        self.assertEqual(response.data['count'], 2)
+
+    def test_book_list_cached_per_query_string(self):
+        """Different filters are cached separately"""
+        self.client.get('/api/books/')
+        response = self.client.get(f'/api/books/?author={self.author1.id}')
+        self.assertEqual(response.data['count'], 1)
+
+    def test_book_list_cached_per_scheme(self):
+        """Pagination links in a cached list match the requesting scheme"""
+        self.client.get('/api/books/?page_size=1')
+        response = self.client.get('/api/books/?page_size=1', secure=True)
+        self.assertTrue(response.data['next'].startswith('https://'))
+
+    def test_book_write_invalidates_list_cache(self):
+        """Saving a book clears cached book and author lists"""
+        self.client.get('/api/books/')
+        self.client.get('/api/authors/')
+        # TestCase never commits; run the on_commit eviction explicitly
+        with self.captureOnCommitCallbacks(execute=True):
+            Book.objects.create(
+                title='A Clash of Kings',
+                publication_year=1998,
+                author=self.author2
+            )
+        self.assertEqual(self.client.get('/api/books/').data['count'], 3)
+        authors = {
+            a['id']: a for a in self.client.get('/api/authors/').data['results']
+        }
+        self.assertEqual(len(authors[self.author2.id]['books']), 2)
+
+    def test_list_cache_cleared_only_on_commit(self):
+        """An uncommitted write leaves the cached list in place"""
+        self.client.get('/api/books/')
+        with self.captureOnCommitCallbacks() as callbacks:
+            Book.objects.create(
+                title='A Clash of Kings',
+                publication_year=1998,
+                author=self.author2
+            )
+            with self.assertNumQueries(0):
+                self.client.get('/api/books/')
+        self.assertTrue(callbacks)
+
+class DetailCacheTests(BookAPITestCase):
+    """Tests for cached and conditional book detail responses"""
+
+    def test_book_detail_served_from_cache(self):
+        """A repeated detail request doesn't touch the database"""
+        url = f'/api/books/{self.book1.id}/'
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.data['title'], self.book1.title)
+
+    def test_book_detail_cache_shared_and_evicted_per_book(self):
+        """Detail cache is shared across users and only evicted for the written book"""
+        url1 = f'/api/books/{self.book1.id}/'
+        url2 = f'/api/books/{self.book2.id}/'
+        self.client.get(url1)
+        self.client.get(url2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.admin_client.patch(
+                f'/api/books/{self.book1.id}/update/', {'title': 'Renamed'}, format='json'
+            )
+        with self.assertNumQueries(0):
+            response = self.admin_client.get(url2)
+        self.assertEqual(response.data['title'], self.book2.title)
+        self.assertEqual(self.client.get(url1).data['title'], 'Renamed')
+
+    def test_book_detail_etag(self):
+        """A matching If-None-Match gets 304 until the book changes"""
+        url = f'/api/books/{self.book1.id}/'
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.admin_client.patch(
+                f'/api/books/{self.book1.id}/update/', {'title': 'Renamed'}, format='json'
+            )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Renamed')
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_book_detail_etag_per_format(self):
+        """A JSON ETag doesn't validate the browsable API representation"""
+        url = f'/api/books/{self.book1.id}/'
+        etag = self.client.get(url, HTTP_ACCEPT='application/json')['ETag']
+        response = self.client.get(url, HTTP_ACCEPT='text/html', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        response = self.client.get(
+            url, HTTP_ACCEPT='text/html', HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_missing_book_mints_no_etag(self):
+        """A 404 detail response doesn't leave an ETag in the cache"""
+        missing_id = max(self.book1.id, self.book2.id) + 1
+        response = self.client.get(f'/api/books/{missing_id}/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(caches['api-details'].get_many(book_detail_cache_keys(missing_id)), {})
+
+class ResponseEncodingTests(BookAPITestCase):
+    """Tests for compressed and conditional list responses"""
+
+    def test_list_gzipped_when_accepted(self):
+        """List responses are gzipped for clients that accept it"""
+        # GZipMiddleware pads its output with up to 100 random bytes and
+        # skips compression when that isn't smaller, so use a body that
+        # compresses well rather than the two-author fixture
+        Book.objects.bulk_create([
+            Book(title=f'A Song of Ice and Fire {n}', publication_year=1996, author=self.author2)
+            for n in range(20)
+        ])
+        response = self.client.get('/api/authors/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_list_conditional_get(self):
+        """A list response carries an ETag and matching requests get 304"""
+        etag = self.client.get('/api/books/')['ETag']
+        response = self.client.get('/api/books/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+class ExceptionHandlerTests(TestCase):
+    """Tests for the API exception handler"""
+
+    def test_pub_year_constraint_is_a_bad_request(self):
+        """The future-year CHECK constraint maps to a 400; other integrity errors don't"""
+        from django.db import IntegrityError
+        from .exceptions import exception_handler
+
+        response = exception_handler(IntegrityError(
+            'new row for relation "api_book" violates check constraint "pub_year_not_future"'
+        ), {})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('publication_year', response.data)
+        self.assertIsNone(exception_handler(IntegrityError('UNIQUE constraint failed'), {}))
+
+class RendererTests(TestCase):
+    """Tests for the orjson-backed JSON renderer"""
+
+    def test_matches_stock_json_renderer(self):
+        """ORJSONRenderer output is byte-for-byte the stock compact JSON"""
+        from decimal import Decimal
+        from uuid import UUID
+        import datetime as dt
+        from django.utils.translation import gettext_lazy
+        from rest_framework.renderers import JSONRenderer
+        from .renderers import ORJSONRenderer
+
+        data = {
+            'title': 'Les Misérables \u2028',
+            'price': Decimal('9.99'),
+            'detail': gettext_lazy('Not found.'),
+            'books': [{'id': 1, 'publication_year': 1862}],
+            'updated': dt.datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=dt.timezone.utc),
+            'published': dt.date(1862, 4, 3),
+            'at': dt.time(12, 30, 15, 250),
+            'uuid': UUID('12345678-1234-5678-1234-567812345678'),
+        }
+        self.assertEqual(
+            ORJSONRenderer().render(data),
+            JSONRenderer().render(data)
+        )
+
 def run_tests():
     """Helper function to demonstrate test execution"""
     import django
     django.setup()
     
     from django.core.management import execute_from_command_line
-    execute_from_command_line(['manage.py', 'test', 'api'])
+    # One worker process per CPU; the SQLite test database is already in-memory
+    execute_from_command_line(['manage.py', 'test', 'api', '--parallel', 'auto'])
     
 if __name__ == '__main__':
     run_tests()
\ No newline at end of file
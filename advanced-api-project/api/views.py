@@ -1,23 +1,89 @@
 # CORRECT IMPORTS - MATCH CHECKER EXPECTATIONS
 from rest_framework import generics, serializers
-from rest_framework import filters  # Separate import for SearchFilter/OrderingFilter
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework import status
-from datetime import datetime
-from .models import Book, Author
-from .serializers import BookSerializer, AuthorSerializer
-from django_filters import rest_framework as filters_django  # Changed import
+from .models import Book, Author, book_detail_cache_keys, invalidate_book_caches
+from .filters import BookFilter, BookListFilterBackend
+from .pagination import ListPagination
+from .serializers import (
+    BookSerializer, AuthorSerializer,
+    BOOK_LIST_FIELDS, list_book_dict, list_author_dict,
+)
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils.cache import quote_etag
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+import hashlib
+import time
 
-class AuthorListCreateView(generics.ListCreateAPIView):
+# Nested books for author endpoints, newest first; served by the
+# (author, publication_year) index
+AUTHOR_BOOKS_PREFETCH = Prefetch(
+    'books',
+    queryset=Book.objects.only(
+        'id', 'title', 'publication_year', 'author_id'
+    ).order_by('-publication_year'),
+)
+
+# List responses are cached per URL (query string, plus the scheme and host
+# used in pagination links) and cleared on any Book/Author write, see
+# api.models.invalidate_list_cache
+LIST_CACHE_TIMEOUT = 60 * 5
+
+# Book detail responses are cached longer; see api.models.invalidate_detail_cache
+DETAIL_CACHE_TIMEOUT = 60 * 60
+
+class CachedListMixin:
+    """
+    Caches GET list data in the 'api-lists' cache, keyed on the query string.
+
+    Unlike cache_page, the key doesn't vary on Cookie, so anonymous and
+    logged-in clients share one entry per query. The data is cached before
+    rendering; each response is still rendered for the client's Accept header.
+    The key covers the scheme and host too: the paginator's next/previous
+    links are absolute URLs built from the request.
+    """
+    list_cache_prefix = None
+
+    def get(self, request, *args, **kwargs):
+        url = request.build_absolute_uri().encode()
+        key = f'{self.list_cache_prefix}:{hashlib.md5(url).hexdigest()}'
+        cache = caches['api-lists']
+        data = cache.get(key)
+        if data is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            data = response.data
+            cache.set(key, data, LIST_CACHE_TIMEOUT)
+        return Response(data)
+
+class AuthorListCreateView(CachedListMixin, generics.ListCreateAPIView):
     """List and create authors"""
-    queryset = Author.objects.all()
+    # Prefetch nested books in one extra query instead of one per author.
+    # Ordered by id so pages are stable.
+    queryset = Author.objects.prefetch_related(AUTHOR_BOOKS_PREFETCH).order_by('id')
     serializer_class = AuthorSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    # Bounded pages, ?page=&page_size= to page through
+    pagination_class = ListPagination
+    list_cache_prefix = 'authors'
+
+    def list(self, request, *args, **kwargs):
+        # Read-only path: build dicts directly instead of running AuthorSerializer
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([list_author_dict(a) for a in page])
+        return Response([list_author_dict(a) for a in queryset])
 
 class AuthorDetailView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, delete authors"""
-    queryset = Author.objects.all()
+    queryset = Author.objects.prefetch_related(AUTHOR_BOOKS_PREFETCH)
     serializer_class = AuthorSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
@@ -25,16 +91,78 @@ class BookGenericUpdateView(generics.UpdateAPIView):
     """
     Generic UpdateView without specific ID
     Usually handles via request data or different logic
+
+    PATCH with {"items": [{"id": ..., <fields>}, ...]} updates many books in
+    one request: one SELECT (in_bulk) and batched UPDATEs (bulk_update).
     """
     queryset = Book.objects.all()
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticated]
+    batch_size = 500
+
+    def patch(self, request, *args, **kwargs):
+        if 'items' not in request.data:
+            return super().patch(request, *args, **kwargs)
+
+        items = request.data['items']
+        if not isinstance(items, list) or not all(
+            isinstance(item, dict) and item.get('id') for item in items
+        ):
+            raise serializers.ValidationError(
+                {"items": "Expected a list of objects, each with an id."}
+            )
+
+        # Coerce ids the way a pk field would ("1" -> 1) so they match the
+        # in_bulk keys, and reject non-integers before they reach the query
+        id_field = serializers.IntegerField()
+        try:
+            ids = [id_field.run_validation(item['id']) for item in items]
+        except serializers.ValidationError:
+            raise serializers.ValidationError({"items": "Each id must be an integer."})
+        # Two items for one book would both write to the same instance
+        if len(set(ids)) != len(ids):
+            raise serializers.ValidationError({"items": "Each book may only appear once."})
+
+        books = Book.objects.select_related('author').in_bulk(ids)
+        missing = [book_id for book_id in ids if book_id not in books]
+        if missing:
+            raise serializers.ValidationError({"items": f"Unknown book ids: {missing}"})
+
+        item_serializers = [
+            self.get_serializer(books[book_id], data=item, partial=True)
+            for book_id, item in zip(ids, items)
+        ]
+        errors = {
+            book_id: s.errors
+            for book_id, s in zip(ids, item_serializers) if not s.is_valid()
+        }
+        if errors:
+            raise serializers.ValidationError({"items": errors})
+
+        changed_fields = set()
+        for s in item_serializers:
+            for field, value in s.validated_data.items():
+                setattr(s.instance, field, value)
+                changed_fields.add(field)
+
+        updated = [s.instance for s in item_serializers]
+        if changed_fields:
+            with transaction.atomic():
+                Book.objects.bulk_update(
+                    updated, sorted(changed_fields), batch_size=self.batch_size
+                )
+            invalidate_book_caches(updated)
+        return Response(BookSerializer(updated, many=True).data)
     
     def get_object(self):
         book_id = self.request.data.get('id')
         if book_id:
-            return Book.objects.get(id=book_id)
-        return Book.objects.first()
+            # Book.save() copies author.name; join it so that isn't an extra query.
+            # The full row is kept: with only('id') the serializer's response
+            # would load each deferred field in its own query.
+            return generics.get_object_or_404(Book.objects.select_related('author'), id=book_id)
+        # No silent fallback to an arbitrary row: reject before querying
+        raise serializers.ValidationError({"id": "This field is required."})
 
 class BookGenericDeleteView(generics.DestroyAPIView):
     """
@@ -47,58 +175,117 @@ class BookGenericDeleteView(generics.DestroyAPIView):
     def get_object(self):
         book_id = self.request.data.get('id')
         if book_id:
-            return Book.objects.get(id=book_id)
-        return Book.objects.first()
+            # Deleting only needs the primary key
+            return generics.get_object_or_404(Book.objects.only('id'), id=book_id)
+        # No silent fallback to an arbitrary row: reject before querying
+        raise serializers.ValidationError({"id": "This field is required."})
 
 # 1. LIST VIEW - Shows all books WITH FILTERING, SEARCHING, ORDERING
-class BookListView(generics.ListAPIView):
+class BookListView(CachedListMixin, generics.ListAPIView):
     """
     ListView: Retrieves all books from the database with advanced query capabilities.
     """
-    queryset = Book.objects.all()
+    # Only the columns BookSerializer emits are loaded. Search and ordering use
+    # the denormalized author_name, so no join with Author is needed.
+    queryset = Book.objects.only(*BOOK_LIST_FIELDS)
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    # Bounded pages, ?page=&page_size= to page through
+    pagination_class = ListPagination
+    list_cache_prefix = 'books'
     
     # UPDATED FILTER BACKENDS
-    filter_backends = [
-        filters_django.DjangoFilterBackend,  # Changed
-        filters.SearchFilter,
-        filters.OrderingFilter,
-    ]
+    # BookListFilterBackend wraps DjangoFilterBackend, SearchFilter and
+    # OrderingFilter and skips the ones with no query parameters
+    filter_backends = [BookListFilterBackend]
     
-    # Step 1: Filtering setup
-    filterset_fields = [
-        'author',
-        'publication_year',
-        'title',
-    ]
+    # Step 1: Filtering setup (see BookFilter)
+    filterset_class = BookFilter
     
     # Step 2: Searching setup
     search_fields = [
         'title',
-        'author__name',
+        'author_name',
     ]
     
     # Step 3: Ordering setup
+    # 'author__name' is kept for existing clients; 'author_name' avoids the join
     ordering_fields = [
         'title',
         'publication_year',
         'author',
+        'author_name',
         'author__name',
     ]
     
     ordering = ['title']
 
+    def list(self, request, *args, **kwargs):
+        # Read-only path: .values() skips model instantiation and
+        # list_book_dict skips BookSerializer's per-field work
+        queryset = self.filter_queryset(self.get_queryset()).values(*BOOK_LIST_FIELDS)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([list_book_dict(b) for b in page])
+        return Response([list_book_dict(b) for b in queryset])
+
+def format_etag(request, token):
+    """
+    ETag for one representation of a book: JSON and the browsable API
+    render the same token differently, so the negotiated format is part of it.
+    """
+    return f'{token}-{request.accepted_renderer.format}'
+
+def book_detail_etag(request, pk):
+    """
+    ETag for a book detail response, if one has been issued.
+    Tokens are only minted by BookDetailView.get after a 200, so requests
+    for missing books don't create cache entries. A fresh token is issued
+    after each Book write evicts the old one, and no database query is
+    needed to answer a conditional GET.
+    """
+    _, etag_key = book_detail_cache_keys(pk)
+    token = caches['api-details'].get(etag_key)
+    return None if token is None else format_etag(request, token)
+
 # 2. DETAIL VIEW - Shows one specific book
+# condition() answers If-None-Match with 304 before the cache or DB is touched
+@method_decorator(condition(etag_func=book_detail_etag), name='get')
 class BookDetailView(generics.RetrieveAPIView):
     """
     DetailView: Retrieves a single book by its ID.
     """
-    queryset = Book.objects.all()
+    # Only the columns BookSerializer emits; 'author' is api_book.author_id,
+    # so no join with Author is needed
+    queryset = Book.objects.only(*BOOK_LIST_FIELDS)
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    def get(self, request, *args, **kwargs):
+        # Cached per book, not per Cookie/Authorization: the data is the
+        # same for every reader, so all clients share one entry
+        data_key, etag_key = book_detail_cache_keys(kwargs['pk'])
+        cache = caches['api-details']
+        cached = cache.get_many([data_key, etag_key])
+        data = cached.get(data_key)
+        etag = cached.get(etag_key)
+        if data is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            data = response.data
+            # Data and token expire together, so a token never outlives
+            # DETAIL_CACHE_TIMEOUT
+            etag = etag or str(time.time_ns())
+            cache.set_many({data_key: data, etag_key: etag}, DETAIL_CACHE_TIMEOUT)
+        response = Response(data)
+        if etag is not None:
+            response['ETag'] = quote_etag(format_etag(request, etag))
+        return response
+
 # 3. CREATE VIEW - Adds a new book
+# The INSERT and the post_save handlers commit (or roll back) together
+@method_decorator(transaction.atomic, name='create')
 class BookCreateView(generics.CreateAPIView):
     """
     CreateView: Adds a new book to the database.
@@ -106,37 +293,18 @@ class BookCreateView(generics.CreateAPIView):
     queryset = Book.objects.all()
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticated]
-    
-    def perform_create(self, serializer):
-        publication_year = serializer.validated_data.get('publication_year')
-        current_year = datetime.now().year
-        
-        if publication_year > current_year:
-            raise serializers.ValidationError(
-                {"publication_year": "Cannot be in the future."}
-            )
-        
-        serializer.save()
+    # Future publication years are rejected by BookSerializer.validate_publication_year
 
 # 4. UPDATE VIEW - Modifies an existing book
 class BookUpdateView(generics.UpdateAPIView):
     """
     UpdateView: Modifies an existing book.
     """
-    queryset = Book.objects.all()
+    # Book.save() copies author.name; join it so that isn't an extra query
+    queryset = Book.objects.select_related('author')
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticated]
-    
-    def perform_update(self, serializer):
-        publication_year = serializer.validated_data.get('publication_year')
-        current_year = datetime.now().year
-        
-        if publication_year and publication_year > current_year:
-            raise serializers.ValidationError(
-                {"publication_year": "Cannot be in the future."}
-            )
-        
-        serializer.save()
+    # Future publication years are rejected by BookSerializer.validate_publication_year
 
 # 5. DELETE VIEW - Removes a book
 class BookDeleteView(generics.DestroyAPIView):
@@ -145,4 +313,29 @@ class BookDeleteView(generics.DestroyAPIView):
     """
     queryset = Book.objects.all()
     serializer_class = BookSerializer
-    permission_classes = [IsAuthenticated]
\ No newline at end of file
+    permission_classes = [IsAuthenticated]
+
+# 6. BULK CREATE VIEW - Adds many books in one request
+class BookBulkCreateView(APIView):
+    """
+    BulkCreateView: Validates a list of books and inserts them in batches.
+    """
+    permission_classes = [IsAuthenticated]
+    batch_size = 1000
+
+    def post(self, request, *args, **kwargs):
+        serializer = BookSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        # One transaction for all batches, so a failure mid-way rolls back
+        # every row rather than leaving earlier batches committed
+        with transaction.atomic():
+            books = Book.objects.bulk_create(
+                [Book(**row) for row in serializer.validated_data],
+                batch_size=self.batch_size,
+            )
+        # Also drops any ETag handed out for these ids (e.g. on an earlier 404)
+        invalidate_book_caches(books)
+        return Response(
+            BookSerializer(books, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
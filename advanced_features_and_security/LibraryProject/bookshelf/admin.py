@@ -6,6 +6,8 @@ class BookAdmin(admin.ModelAdmin):
     list_display = ("title", "author", "published_date")
     search_fields = ("title", "author")
     list_filter = ("published_date",)
+    # Plain id input instead of a <select> listing every user
+    raw_id_fields = ("owner",)
 
 admin.site.register(Book, BookAdmin)
 
@@ -1,3 +1,4 @@
+from django.core.paginator import Paginator
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import permission_required
 from .models import Book
@@ -5,8 +6,10 @@ from .forms import ExampleForm
 
 @permission_required('bookshelf.can_view', raise_exception=True)
 def book_list(request):
-    books = Book.objects.all()
-    return render(request, 'bookshelf/book_list.html', {'books': books})
+    # One page of rows at a time, as dicts with only the listed columns
+    books = Book.objects.values('id', 'title', 'author', 'published_date').order_by('id')
+    page = Paginator(books, 50).get_page(request.GET.get('page'))
+    return render(request, 'bookshelf/book_list.html', {'books': page})
 
 @permission_required('bookshelf.can_create', raise_exception=True)
 def book_create(request):
@@ -21,10 +21,15 @@ class LibraryDetailView(DetailView):
     model = Library
     template_name = 'relationship_app/library_detail.html'
     context_object_name = 'library'
+
+    def get_queryset(self):
+        # Load the library's books in one extra query; book.author is a plain
+        # CharField, so there is nothing to join
+        return super().get_queryset().prefetch_related('books')
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # Add all books available in this library to the context
+        # Add all books available in this library to the context (prefetched)
         context['books'] = self.object.books.all()
         return context
     